@@ -1,19 +1,28 @@
+import heapq
 import os
+import pwd
+import select
 import sys
-import time
-import signal
 import tempfile
+import time
 from datetime import datetime
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+)
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QPushButton,
     QAbstractItemView,
@@ -31,6 +40,102 @@ except ImportError as exc:
     ) from exc
 
 
+_BYTES_TO_MB = 1.0 / (1024 * 1024)
+_EQ72 = "=" * 72
+_DASH72 = "-" * 72
+
+_PROC_ERRORS = (psutil.NoSuchProcess, psutil.AccessDenied)
+
+# Enum attribute resolution is not free in PyQt6; bind the per-cell
+# lookups once at import time.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_CHECK_ROLE = Qt.ItemDataRole.CheckStateRole
+_ALIGN_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+_CHECK_CHECKED = Qt.CheckState.Checked
+_CHECK_UNCHECKED = Qt.CheckState.Unchecked
+_CHECK_FLAGS = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+_ROW_FLAGS = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+
+class _WorkerSignals(QObject):
+    finished = pyqtSignal(object)
+
+
+class _Worker(QRunnable):
+    """Runs a blocking callable on the pool and emits its result."""
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _WorkerSignals()
+
+    def run(self) -> None:
+        self.signals.finished.emit(self.fn(*self.args))
+
+
+class ProcessTableModel(QAbstractTableModel):
+    HEADERS = ["Select", "PID", "Process", "RAM (MB)", "% MEM"]
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.rows: list[dict] = []
+        self.checked_pids: set[int] = set()
+
+    def set_rows(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.checked_pids &= {row["pid"] for row in rows}
+        self.layoutChanged.emit()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role=_DISPLAY_ROLE):
+        row = self.rows[index.row()]
+        col = index.column()
+        if col == 0:
+            if role == _CHECK_ROLE:
+                return _CHECK_CHECKED if row["pid"] in self.checked_pids else _CHECK_UNCHECKED
+            return None
+        if role == _DISPLAY_ROLE:
+            if col == 1:
+                return str(row["pid"])
+            if col == 2:
+                return row["name"]
+            if col == 3:
+                return f"{row['mem_mb']:.1f}"
+            if col == 4:
+                return f"{row['mem_pct']:.1f}"
+        if role == _ALIGN_ROLE and col != 2:
+            return _ALIGN_RIGHT
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if index.column() == 0:
+            return _CHECK_FLAGS
+        return _ROW_FLAGS
+
+    def setData(self, index: QModelIndex, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if index.column() == 0 and role == _CHECK_ROLE:
+            pid = self.rows[index.row()]["pid"]
+            if Qt.CheckState(value) == _CHECK_CHECKED:
+                self.checked_pids.add(pid)
+            else:
+                self.checked_pids.discard(pid)
+            self.dataChanged.emit(index, index, [_CHECK_ROLE])
+            return True
+        return False
+
+
 class SummaryDialog(QDialog):
     def __init__(self, parent: QWidget, summary_text: str):
         super().__init__(parent)
@@ -64,6 +169,9 @@ class RamManagerWindow(QMainWindow):
 
         self.temp_dir = tempfile.mkdtemp(prefix="ram_manager_")
         self.log_file = os.path.join(self.temp_dir, "ram_manager.log")
+        self.log_fp = open(self.log_file, "a", encoding="utf-8", buffering=8192)
+        self._last_ts_sec = -1
+        self._last_ts_str = ""
         self.terminated: list[str] = []
         self.failed: list[str] = []
         self.menu_rows: list[dict] = []
@@ -76,18 +184,21 @@ class RamManagerWindow(QMainWindow):
         self.info_label = QLabel("Identify and terminate memory‑intensive processes.")
         root.addWidget(self.info_label)
 
-        self.table = QTableWidget(0, 5)
+        self.model = ProcessTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Select", "PID", "Process", "RAM (MB)", "% MEM"])
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        vheader = self.table.verticalHeader()
+        vheader.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vheader.setDefaultSectionSize(self.fontMetrics().height() + 6)
         root.addWidget(self.table)
 
         btns = QHBoxLayout()
@@ -104,99 +215,94 @@ class RamManagerWindow(QMainWindow):
         self.terminate_btn.clicked.connect(self.terminate_selected)
         self.summary_btn.clicked.connect(self.show_summary)
 
+        self.thread_pool = QThreadPool.globalInstance()
+
+        self._vm_cache = None
+        self._vm_cache_ts = 0.0
         self.ram_before_mb = self.get_total_ram_usage_mb()
         self.ram_after_mb = None
+        self._username = os.getenv("USER") or pwd.getpwuid(os.getuid()).pw_name
         self.log_message("=== RAM Management App Started ===")
-        self.log_message(f"User: {psutil.Process().username()}")
+        self.log_message(f"User: {self._username}")
         self.log_message(f"Initial RAM usage: {self.ram_before_mb} MB")
         self.refresh_process_list()
 
     def log_message(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        line = f"[{timestamp}] {message}\n"
+        sec = int(time.time())
+        if sec != self._last_ts_sec:
+            self._last_ts_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            self._last_ts_sec = sec
         try:
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(line)
+            self.log_fp.write(f"[{self._last_ts_str}] {message}\n")
         except Exception:
             pass
 
-    def get_total_ram_usage_mb(self) -> int:
-        total_rss = 0
-        for proc in psutil.process_iter(attrs=["memory_info"]):
-            try:
-                mem = proc.info.get("memory_info")
-                if mem is not None:
-                    total_rss += getattr(mem, "rss", 0)
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        return int(total_rss / (1024 * 1024))
+    def closeEvent(self, event) -> None:
+        try:
+            self.log_fp.close()
+        except Exception:
+            pass
+        super().closeEvent(event)
+
+    def _virtual_memory(self):
+        """psutil.virtual_memory() memoized for 0.5s to absorb repeated clicks."""
+        now = time.monotonic()
+        if self._vm_cache is None or now - self._vm_cache_ts >= 0.5:
+            self._vm_cache = psutil.virtual_memory()
+            self._vm_cache_ts = now
+        return self._vm_cache
 
-    def get_available_memory_mb(self) -> int:
-        vm = psutil.virtual_memory()
-        return int(vm.available / (1024 * 1024))
+    def get_total_ram_usage_mb(self) -> int:
+        vm = self._virtual_memory()
+        return int((vm.total - vm.available) / (1024 * 1024))
 
     def fetch_top_processes(self) -> list[dict]:
-        items: list[dict] = []
-        for proc in psutil.process_iter(attrs=["pid", "name", "memory_info", "memory_percent"]):
+        # Bounded min-heap of (rss, pid, name) tuples: only the current
+        # top-10 survivors are ever held, and dicts are built just for them.
+        heap: list[tuple] = []
+        pct_scale = 100.0 / self._virtual_memory().total
+        for proc in psutil.process_iter():
             try:
-                info = proc.info
-                mem = info.get("memory_info")
-                mem_rss = int(getattr(mem, "rss", 0))
-                mem_mb = mem_rss / (1024 * 1024)
-                mem_pct = info.get("memory_percent") or 0.0
-                name = info.get("name") or "(unknown)"
-                items.append(
-                    {
-                        "pid": int(info.get("pid")),
-                        "name": name,
-                        "mem_mb": float(f"{mem_mb:.1f}"),
-                        "mem_pct": float(f"{mem_pct:.1f}"),
-                        "rss": mem_rss,
-                    }
-                )
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                with proc.oneshot():
+                    mem_rss = int(proc.memory_info().rss)
+                    # Kernel threads report rss == 0 and can never rank;
+                    # likewise anything at or below the current heap minimum
+                    # is skipped before paying for name/percent reads.
+                    if mem_rss == 0:
+                        continue
+                    if len(heap) == 10 and mem_rss <= heap[0][0]:
+                        continue
+                    name = proc.name() or "(unknown)"
+                entry = (mem_rss, proc.pid, name)
+                if len(heap) < 10:
+                    heapq.heappush(heap, entry)
+                else:
+                    heapq.heapreplace(heap, entry)
+            except _PROC_ERRORS:
                 continue
-        items.sort(key=lambda x: x["rss"], reverse=True)
-        return items[:10]
+        heap.sort(reverse=True)
+        return [
+            {
+                "pid": pid,
+                "name": name,
+                "mem_mb": rss * _BYTES_TO_MB,
+                "mem_pct": rss * pct_scale,
+                "rss": rss,
+            }
+            for rss, pid, name in heap
+        ]
 
     def refresh_process_list(self) -> None:
-        self.menu_rows = self.fetch_top_processes()
-        self.table.setRowCount(len(self.menu_rows))
-        for row, item in enumerate(self.menu_rows):
-            select_item = QTableWidgetItem()
-            select_item.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            select_item.setCheckState(Qt.CheckState.Unchecked)
-            self.table.setItem(row, 0, select_item)
-
-            pid_item = QTableWidgetItem(str(item["pid"]))
-            pid_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 1, pid_item)
-
-            name_item = QTableWidgetItem(item["name"]) 
-            self.table.setItem(row, 2, name_item)
+        worker = _Worker(self.fetch_top_processes)
+        worker.signals.finished.connect(self._on_processes_fetched)
+        self.thread_pool.start(worker)
 
-            mem_item = QTableWidgetItem(f"{item['mem_mb']:.1f}")
-            mem_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 3, mem_item)
-
-            pct_item = QTableWidgetItem(f"{item['mem_pct']:.1f}")
-            pct_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 4, pct_item)
-
-        self.table.resizeRowsToContents()
+    def _on_processes_fetched(self, rows: list) -> None:
+        self.menu_rows = rows
+        self.model.set_rows(rows)
 
     def _selected_pids(self) -> list[int]:
-        pids: list[int] = []
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item is not None and item.checkState() == Qt.CheckState.Checked:
-                pid_item = self.table.item(row, 1)
-                if pid_item is not None:
-                    try:
-                        pids.append(int(pid_item.text()))
-                    except ValueError:
-                        continue
-        return pids
+        return list(self.model.checked_pids)
 
     def terminate_selected(self) -> None:
         pids = self._selected_pids()
@@ -204,102 +310,156 @@ class RamManagerWindow(QMainWindow):
             QMessageBox.information(self, "No Selection", "No processes were selected for termination.")
             return
 
-        self.terminated = []
-        self.failed = []
+        self.terminate_btn.setEnabled(False)
+        worker = _Worker(self._terminate_pids, pids)
+        worker.signals.finished.connect(self._on_terminate_done)
+        self.thread_pool.start(worker)
 
-        for pid in pids:
-            proc_desc = self._format_proc_desc(pid)
-            self.log_message(f"Attempting to terminate: {proc_desc}")
-            ok = self._terminate_with_fallback(pid)
-            if ok:
-                self.terminated.append(proc_desc)
-                self.log_message(f"Successfully terminated: {proc_desc}")
-            else:
-                self.failed.append(proc_desc + " (Insufficient permissions or busy)")
-                self.log_message(f"Failed to terminate: {proc_desc}")
+    def _terminate_pids(self, pids: list[int]) -> tuple[list[str], list[str]]:
+        terminated: list[str] = []
+        failed: list[str] = []
+        descs: dict[int, str] = {}
+        procs: list[psutil.Process] = []
 
-        time.sleep(1.5)
+        for pid in pids:
+            desc = self._format_proc_desc(pid)
+            descs[pid] = desc
+            self.log_message(f"Attempting to terminate: {desc}")
+            try:
+                proc = psutil.Process(pid)
+                proc.terminate()
+                procs.append(proc)
+            except psutil.NoSuchProcess:
+                terminated.append(desc)
+                self.log_message(f"Successfully terminated: {desc}")
+            except psutil.AccessDenied:
+                # SIGTERM was refused; still give SIGKILL a chance below.
+                procs.append(proc)
+
+        gone, alive = self._wait_procs(procs, timeout=1.0)
+        for proc in alive:
+            try:
+                proc.kill()
+            except _PROC_ERRORS:
+                pass
+        killed, alive = self._wait_procs(alive, timeout=0.5)
+
+        for proc in gone + killed:
+            desc = descs[proc.pid]
+            terminated.append(desc)
+            self.log_message(f"Successfully terminated: {desc}")
+        for proc in alive:
+            desc = descs[proc.pid]
+            failed.append(desc + " (Insufficient permissions or busy)")
+            self.log_message(f"Failed to terminate: {desc}")
+        return terminated, failed
+
+    def _on_terminate_done(self, result: tuple) -> None:
+        self.terminated, self.failed = result
+        self._vm_cache = None
         self.ram_after_mb = self.get_total_ram_usage_mb()
         self.log_message(f"Final RAM usage: {self.ram_after_mb} MB")
+        self.terminate_btn.setEnabled(True)
         self.refresh_process_list()
-
         self.show_summary()
 
-    def _terminate_with_fallback(self, pid: int) -> bool:
-        if not psutil.pid_exists(pid):
-            return True
-        try:
-            os.kill(pid, signal.SIGTERM)
-        except PermissionError:
-            pass
-        except ProcessLookupError:
-            return True
+    def _wait_procs(self, procs: list, timeout: float) -> tuple[list, list]:
+        """Split procs into (gone, alive) after waiting up to timeout seconds.
 
-        deadline = time.time() + 1.0
-        while time.time() < deadline:
-            if not psutil.pid_exists(pid):
-                return True
-            time.sleep(0.1)
+        On Linux this blocks in one poll() over pidfds for the whole batch;
+        elsewhere (macOS/BSD) it falls back to psutil.wait_procs.
+        """
+        if not procs:
+            return [], []
+        if not hasattr(os, "pidfd_open"):
+            return psutil.wait_procs(procs, timeout=timeout)
 
+        gone: list = []
+        fd_procs: dict = {}
+        poller = select.poll()
         try:
-            os.kill(pid, signal.SIGKILL)
-        except PermissionError:
-            return False
-        except ProcessLookupError:
-            return True
-
-        time.sleep(0.5)
-        return not psutil.pid_exists(pid)
+            for proc in procs:
+                try:
+                    fd = os.pidfd_open(proc.pid)
+                except ProcessLookupError:
+                    gone.append(proc)
+                    continue
+                except OSError:
+                    # pidfd unavailable for this pid; take the portable path.
+                    return psutil.wait_procs(procs, timeout=timeout)
+                fd_procs[fd] = proc
+                poller.register(fd, select.POLLIN)
+
+            deadline = time.monotonic() + timeout
+            pending = dict(fd_procs)
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for fd, _event in poller.poll(max(1, int(remaining * 1000))):
+                    gone.append(pending.pop(fd))
+            return gone, list(pending.values())
+        finally:
+            for fd in fd_procs:
+                os.close(fd)
 
     def _format_proc_desc(self, pid: int) -> str:
         try:
             p = psutil.Process(pid)
-            rss_mb = int(p.memory_info().rss / (1024 * 1024))
+            rss_mb = int(p.memory_info().rss * _BYTES_TO_MB)
             name = p.name()
             return f"PID {pid}: {name} ({rss_mb} MB)"
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+        except _PROC_ERRORS:
             return f"PID {pid}: (unknown)"
 
     def _build_summary_text(self) -> str:
-        ram_after = self.ram_after_mb if self.ram_after_mb is not None else self.get_total_ram_usage_mb()
+        vm = self._virtual_memory()
+        if self.ram_after_mb is not None:
+            ram_after = self.ram_after_mb
+        else:
+            ram_after = int((vm.total - vm.available) / (1024 * 1024))
         ram_freed = max(self.ram_before_mb - ram_after, 0)
-        available_after = self.get_available_memory_mb()
-
-        lines: list[str] = []
-        lines.append("=" * 72)
-        lines.append("RAM MANAGEMENT SUMMARY")
-        lines.append("=" * 72)
-        lines.append("")
-        lines.append("RAM USAGE STATISTICS:")
-        lines.append(f"  Before Operation:  {self.ram_before_mb} MB")
-        lines.append(f"  After Operation:   {ram_after} MB")
-        lines.append(f"  RAM Freed:         {ram_freed} MB")
-        lines.append(f"  Available Memory:  {available_after} MB")
-        lines.append("")
-        lines.append("-" * 72)
-        lines.append("")
+        available_after = int(vm.available / (1024 * 1024))
+
         if self.terminated:
-            lines.append(f"SUCCESSFULLY TERMINATED PROCESSES ({len(self.terminated)}):")
-            for t in self.terminated:
-                lines.append(f"  \u2713 {t}")
-            lines.append("")
+            terminated_block = (
+                f"SUCCESSFULLY TERMINATED PROCESSES ({len(self.terminated)}):\n"
+                + "\n".join(f"  \u2713 {t}" for t in self.terminated)
+            )
         else:
-            lines.append("SUCCESSFULLY TERMINATED PROCESSES: None")
-            lines.append("")
+            terminated_block = "SUCCESSFULLY TERMINATED PROCESSES: None"
+
+        sections = [terminated_block]
         if self.failed:
-            lines.append(f"FAILED TO TERMINATE ({len(self.failed)}):")
-            for f in self.failed:
-                lines.append(f"  \u2717 {f}")
-            lines.append("")
-            lines.append("NOTE: Failed terminations may require administrator privileges.")
-            lines.append("      Run with 'sudo' or use Activity Monitor with admin rights.")
-            lines.append("")
-        lines.append("-" * 72)
-        lines.append("")
-        lines.append(f"Operation completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
-        lines.append(f"Log file: {self.log_file}")
-        return "\n".join(lines)
+            sections.append(
+                f"FAILED TO TERMINATE ({len(self.failed)}):\n"
+                + "\n".join(f"  \u2717 {f}" for f in self.failed)
+                + "\n\nNOTE: Failed terminations may require administrator privileges.\n"
+                "      Run with 'sudo' or use Activity Monitor with admin rights."
+            )
+        body = "\n\n".join(sections)
+
+        return (
+            f"{_EQ72}\n"
+            "RAM MANAGEMENT SUMMARY\n"
+            f"{_EQ72}\n"
+            "\n"
+            "RAM USAGE STATISTICS:\n"
+            f"  Before Operation:  {self.ram_before_mb} MB\n"
+            f"  After Operation:   {ram_after} MB\n"
+            f"  RAM Freed:         {ram_freed} MB\n"
+            f"  Available Memory:  {available_after} MB\n"
+            "\n"
+            f"{_DASH72}\n"
+            "\n"
+            f"{body}\n"
+            "\n"
+            f"{_DASH72}\n"
+            "\n"
+            f"Operation completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+            "\n"
+            f"Log file: {self.log_file}"
+        )
 
     def show_summary(self) -> None:
         summary = self._build_summary_text()